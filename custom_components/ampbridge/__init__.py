@@ -12,7 +12,7 @@ from .coordinator import AmpBridgeCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SWITCH, Platform.NUMBER, Platform.SELECT]
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SWITCH, Platform.NUMBER, Platform.SELECT]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -26,6 +26,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Start the coordinator
     await coordinator.async_start()
 
+    # async_start has finished discovery, so the platforms can build their
+    # entities straight from coordinator.discovered_zones
+    if not coordinator.discovered_zones:
+        _LOGGER.warning("No AmpBridge zones discovered")
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
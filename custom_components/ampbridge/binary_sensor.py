@@ -1,21 +1,26 @@
 """Binary sensor platform for AmpBridge integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ICON_CONNECTIVITY
+from .const import DOMAIN, ICON_CONNECTIVITY, MAX_ZONES
 from .coordinator import AmpBridgeCoordinator
+from .entity import AmpBridgeZoneEntity, async_setup_zone_entities
 
 _LOGGER = logging.getLogger(__name__)
 
+# Interned unique ids indexed by zone_id
+_UNIQUE_IDS = tuple(
+    sys.intern(f"ampbridge_zone_{zone_id}_connected") for zone_id in range(MAX_ZONES)
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,67 +30,28 @@ async def async_setup_entry(
     """Set up AmpBridge binary sensors based on a config entry."""
     coordinator: AmpBridgeCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    # Create binary sensors for discovered zones
-    entities = []
-    
-    # Wait for zones to be discovered via MQTT
-    for _ in range(50):  # 50 * 0.2s = 10 seconds
-        if coordinator.data:
-            break
-        await asyncio.sleep(0.2)
-    
     # Create binary sensors for all discovered zones
-    for zone_id, zone_data in coordinator.data.items():
-        # Only create connected sensor - mute is handled by switch entity
-        entities.append(
-            AmpBridgeConnectedBinarySensor(coordinator, config_entry, zone_id, zone_data.get("name", f"Zone {zone_id + 1}"))
-        )
-
-    async_add_entities(entities)
+    # Only create connected sensor - mute is handled by switch entity
+    async_setup_zone_entities(hass, config_entry, coordinator, async_add_entities, AmpBridgeConnectedBinarySensor)
 
 
 # AmpBridgeMuteBinarySensor removed - using AmpBridgeMuteSwitch instead
 
-class AmpBridgeConnectedBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class AmpBridgeConnectedBinarySensor(AmpBridgeZoneEntity, BinarySensorEntity):
     """Representation of an AmpBridge connected binary sensor."""
 
     def __init__(self, coordinator: AmpBridgeCoordinator, config_entry: ConfigEntry, zone_id: int, zone_name: str):
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._zone_id = zone_id
-        self._zone_name = zone_name
-        # Name will be dynamic via property
-        self._attr_unique_id = f"ampbridge_zone_{zone_id}_connected"
+        super().__init__(coordinator, config_entry, zone_id, zone_name)
+        self._attr_unique_id = _UNIQUE_IDS[zone_id]
         self._attr_icon = ICON_CONNECTIVITY
         self._attr_device_class = "connectivity"
-        # Device info will be dynamic via property
 
     @property
     def name(self) -> str:
         """Return the name of the binary sensor."""
         return "Connected"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        zone_data = self.coordinator.data.get(self._zone_id)
-        if zone_data:
-            current_name = zone_data.get("name", f"Zone {self._zone_id + 1}")
-        else:
-            current_name = f"Zone {self._zone_id + 1}"
-        
-        return {
-            "identifiers": {(DOMAIN, f"zone_{self._zone_id}")},
-            "name": f"AmpBridge - {current_name}",
-            "manufacturer": "AmpBridge",
-            "model": "Audio Zone",
-        }
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return the state of the binary sensor."""
-        zone_data = self.coordinator.data.get(self._zone_id)
-        if zone_data:
-            return zone_data.get("connected") == "ON"
-        return None
+    def _update_from_zone(self, zone_data: dict[str, Any] | None) -> None:
+        """Store the zone connection state."""
+        self._attr_is_on = zone_data.get("connected") == "ON" if zone_data else None
@@ -6,6 +6,16 @@ DOMAIN = "ampbridge"
 MQTT_BASE_TOPIC = "ampbridge/zones"
 MQTT_STATUS_TOPIC = f"{MQTT_BASE_TOPIC}/status"
 
+# Highest number of zones tracked per AmpBridge; zone ids are 0-based.
+# Well above real installations; discovery warns about any zone beyond it
+MAX_ZONES = 256
+
+# Fallback names for zones without a name, indexed by zone_id
+DEFAULT_ZONE_NAMES = tuple(f"Zone {zone_id + 1}" for zone_id in range(MAX_ZONES))
+
+# Dispatcher signal for zones discovered after setup, suffixed with the entry id
+SIGNAL_NEW_ZONES = f"{DOMAIN}_new_zones"
+
 # Zone attributes
 ZONE_ATTRIBUTES = ["volume", "mute", "source", "connected", "name"]
 
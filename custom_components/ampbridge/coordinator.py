@@ -2,22 +2,143 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import functools
 import logging
-from typing import Any
+import re
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 import aiohttp
-import paho.mqtt.client as mqtt
+import aiomqtt
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN, MQTT_BASE_TOPIC
+from .const import DEFAULT_ZONE_NAMES, DOMAIN, MAX_ZONES, MQTT_BASE_TOPIC, SIGNAL_NEW_ZONES
 
 _LOGGER = logging.getLogger(__name__)
 _LOG_PREFIX = "[AmpBridge:source]"
 
 
+def _decode(payload: bytes) -> str:
+    """Decode a text payload."""
+    return payload.decode(errors="replace")
+
+
+def _parse_volume(payload: bytes) -> float | None:
+    """Parse an integer volume payload as a float, returning None if it is invalid.
+
+    Stored as float so entities can report it as their native value unconverted.
+    """
+    try:
+        return float(int(payload))
+    except ValueError:
+        _LOGGER.warning(f"Invalid volume value: {payload!r}")
+        return None
+
+
+def _on_off(payload: bytes) -> str:
+    """Normalize an ON/OFF payload without decoding it."""
+    return "ON" if payload == b"ON" else "OFF"
+
+
+def _api_volume(value: Any) -> float | None:
+    """Convert an API zone volume to float, returning None if it is missing or invalid."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        _LOGGER.warning(f"Invalid volume value from API: {value!r}")
+        return None
+
+
+def _zone_from_api(zone: Mapping[str, Any]) -> dict[str, Any]:
+    """Convert an API zone to the coordinator's zone format."""
+    return {
+        "zone_id": zone["id"],
+        "name": zone.get("name"),
+        "volume": _api_volume(zone.get("volume")),
+        "mute": "ON" if zone.get("muted") else "OFF",
+        "source": zone.get("source"),
+        "connected": "ON" if zone.get("connected") else "OFF",
+        "available_sources": zone.get("available_sources") or [],
+    }
+
+
+# ampbridge/zones/{zone_id}/{attribute}; command topics (.../set) don't match
+_ZONE_TOPIC_RE = re.compile(rf"{re.escape(MQTT_BASE_TOPIC)}/(\d+)/([a-z_]+)")
+
+# Parsers for the raw zone attribute payloads published on
+# ampbridge/zones/{zone_id}/{attribute}; only text attributes are decoded and a
+# parser returns None for a payload that should be ignored
+_ATTR_PARSERS: dict[str, Callable[[bytes], Any]] = {
+    "name": _decode,
+    "volume": _parse_volume,
+    "mute": _on_off,
+    "source": _decode,
+    "connected": _on_off,
+}
+
+# (topic filter, QoS) for every zone state topic handled above
+_ZONE_SUBSCRIPTIONS = [(f"{MQTT_BASE_TOPIC}/+/{attribute}", 0) for attribute in _ATTR_PARSERS]
+
+# Seconds during which a matching MQTT echo of an optimistic update is ignored
+_OPTIMISTIC_ECHO_WINDOW = 1.0
+
+# "Off" and legacy display names mapped to AmpBridge "Source N" inputs
+_HARDCODED_SOURCE_MAP: Mapping[str, str] = MappingProxyType({
+    "Off": "Off",
+    "Echo": "Source 1",
+    "Server": "Source 2",
+    "TV": "Source 3",
+    "Bluetooth": "Source 4",
+    "Aux": "Source 5",
+    "CD": "Source 6",
+    "Tuner": "Source 7",
+    "Phono": "Source 8",
+})
+_SOURCE_N_RE = re.compile(r"Source \d+")
+
+# Timeout for AmpBridge HTTP API requests
+_API_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Backoff bounds in seconds for reconnecting to the MQTT broker
+_RECONNECT_MIN_DELAY = 1
+_RECONNECT_MAX_DELAY = 30
+
+# Seconds to collect MQTT messages of unknown zones before rediscovering them
+_NEW_ZONES_DELAY = 0.1
+# Minimum seconds between rediscoveries triggered by the same unknown zone
+_NEW_ZONES_RETRY_INTERVAL = 60
+
+
+@functools.lru_cache(maxsize=64)
+def _map_source(source_name: str, available_sources: tuple[str, ...]) -> str | None:
+    """Map a source name to AmpBridge format given the backend source order.
+
+    Returns None if the name can't be mapped. Pure, so results stay valid in
+    the cache whatever the source order; callers do the logging.
+    """
+    # First try "Off" and the hardcoded mappings for backwards compatibility
+    out = _HARDCODED_SOURCE_MAP.get(source_name)
+    if out is not None:
+        return out
+
+    # If not in hardcoded mapping, look up in available sources using
+    # backend order (same order as API) so "Source N" matches backend index
+    if source_name in available_sources:
+        return f"Source {available_sources.index(source_name) + 1}"
+
+    # If it's already in "Source X" format, return as-is
+    if _SOURCE_N_RE.fullmatch(source_name):
+        return source_name
+    return None
+
+
 class AmpBridgeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage AmpBridge MQTT data."""
 
@@ -25,113 +146,273 @@ class AmpBridgeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Initialize the coordinator."""
         self.hass = hass
         self.entry = entry
-        self.mqtt_client: mqtt.Client | None = None
+        self.mqtt_client: aiomqtt.Client | None = None
         self.connected = False
+        # Shared with listeners as coordinator.data: the dict identity is stable,
+        # only its contents change
         self.zones: dict[int, dict[str, Any]] = {}
+        # The same zone dicts indexed by zone_id for the entities' lookups
+        self.zone_slots: list[dict[str, Any] | None] = [None] * MAX_ZONES
         self.api_url = f"http://{entry.data['host']}:4000/api"
+        # Coalesce bursts of MQTT updates into one listener refresh per window
+        self._pending = False
+        self._batch_delay = 0.05
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Entity callbacks per zone and the zones changed since the last flush
+        self._zone_listeners: dict[int, list[Callable[[], None]]] = {}
+        self._dirty_zones: set[int] = set()
+        # Background task owning the MQTT connection
+        self._mqtt_task: asyncio.Task | None = None
+        # (zone_id, name) of the zones found by API discovery, used by the
+        # platforms to create their entities
+        self.discovered_zones: list[tuple[int, str]] = []
+        # Set once the initial API discovery has finished (successfully or not);
+        # unknown zones seen on MQTT before that are not rediscovered
+        self.discovery_ready = asyncio.Event()
+        # Dispatcher signal carrying the (zone_id, name) of zones added after
+        # setup; the platforms create their entities for them
+        self.signal_new_zones = f"{SIGNAL_NEW_ZONES}_{entry.entry_id}"
+        # Unknown zone ids seen on MQTT: when each last triggered a rediscovery,
+        # and those awaiting the debounced rediscovery
+        self._requested_zones: dict[int, float] = {}
+        self._pending_new_zones: set[int] = set()
+        self._new_zones_unsub: Callable[[], None] | None = None
+        self._new_zones_task: asyncio.Task | None = None
+        # Optimistic values awaiting their MQTT echo: (zone_id, attribute) -> (value, sent at)
+        self._optimistic: dict[tuple[int, str], tuple[Any, float]] = {}
+        # Command topic prefix (ampbridge/zones/{zone_id}/) per discovered zone
+        self._zone_topic_prefix: dict[int, str] = {}
+        # Backend-ordered source names
+        self._sources_cache: tuple[str, ...] | None = None
+        # Select dropdown lists built from the source cache
+        self._available_sources: tuple[str, ...] | None = None
+        self._source_options: tuple[str, ...] | None = None
         
-        # Initialize with empty data
+        # No update_interval: data is pushed via MQTT messages
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=None,  # We'll update via MQTT messages
         )
+        # Expose the live zones without notifying listeners; entities are only
+        # created after async_start has run discovery
+        self.data = self.zones
 
     async def async_start(self) -> None:
         """Start the MQTT client and discover zones."""
-        # First discover zones via API
+        # Connect to MQTT in the background while discovering zones via API.
+        # MQTT messages for zones that are not discovered yet are ignored by
+        # _apply_message.
+        self._mqtt_task = self.entry.async_create_background_task(
+            self.hass, self._mqtt_loop(), "ampbridge mqtt"
+        )
         await self._discover_zones_via_api()
-        
-        # Then start MQTT client
-        await self.hass.async_add_executor_job(self._start_mqtt_client)
 
-    def _start_mqtt_client(self) -> None:
-        """Start the MQTT client in executor thread."""
-        self.mqtt_client = mqtt.Client()
-        self.mqtt_client.on_connect = self._on_connect
-        self.mqtt_client.on_message = self._on_message
-        self.mqtt_client.on_disconnect = self._on_disconnect
+    async def _mqtt_loop(self) -> None:
+        """Keep the MQTT connection open and apply incoming messages."""
+        host = self.entry.data["host"]
+        port = self.entry.data["port"]
+        reconnect_delay = _RECONNECT_MIN_DELAY
+        while True:
+            try:
+                _LOGGER.info(f"Connecting to MQTT broker at {host}:{port}")
+                # Clean session: the zone topics are QoS 0 and retained, so a
+                # persistent session would replay nothing after a reconnect and
+                # only leave a stale session on the broker; the retained
+                # states resync the zones on every subscribe instead
+                async with aiomqtt.Client(
+                    host,
+                    port,
+                    identifier=f"ha-ampbridge-{self.entry.entry_id}",
+                    clean_session=True,
+                    keepalive=60,
+                ) as client:
+                    _LOGGER.info("Connected to MQTT broker")
+                    reconnect_delay = _RECONNECT_MIN_DELAY
+                    self.mqtt_client = client
+                    self.connected = True
+                    # Subscribe only to the zone state topics we parse, so the
+                    # broker filters out command echoes and other subtopics
+                    await client.subscribe(_ZONE_SUBSCRIPTIONS)
+                    _LOGGER.info("Subscribed to %s", [topic for topic, _ in _ZONE_SUBSCRIPTIONS])
+                    await self._consume(client)
+            except aiomqtt.MqttError as err:
+                _LOGGER.warning(f"Disconnected from MQTT broker: {err}")
+            except Exception:
+                # Reconnect with backoff instead of silently ending the task;
+                # CancelledError is not an Exception and still stops the loop
+                _LOGGER.exception("Unexpected error in the MQTT connection, reconnecting")
+            finally:
+                self.mqtt_client = None
+                self.connected = False
+            await asyncio.sleep(reconnect_delay)
+            reconnect_delay = min(reconnect_delay * 2, _RECONNECT_MAX_DELAY)
 
+    async def _consume(self, client: aiomqtt.Client) -> None:
+        """Apply MQTT messages to the zones as they arrive on the event loop."""
+        async for message in client.messages:
+            try:
+                changed = self._apply_message(message.topic.value, message.payload)
+            except Exception:
+                # A bad message must not end the MQTT task and stop all updates
+                _LOGGER.exception("Error handling MQTT message on %s", message.topic.value)
+                continue
+            # Bursts are coalesced into one update per batch window
+            if changed:
+                self._schedule_flush()
+
+    def _apply_message(self, topic: str, payload: bytes) -> bool:
+        """Apply a single MQTT message to the zones, returning True if it changed state.
+
+        Every parse step rejects bad input by returning early (non-matching topic,
+        unknown attribute or zone, parser returning None); anything unexpected
+        that still raises is logged per message by _consume.
+        """
+        _LOGGER.debug("Received MQTT message: %s = %r", topic, payload)
+
+        # Parse topic to extract zone info
+        # Expected format: ampbridge/zones/{zone_id}/{attribute}
+        match = _ZONE_TOPIC_RE.fullmatch(topic)
+        if match is None:
+            return False
+        zone_str, attribute = match.groups()
+        parser = _ATTR_PARSERS.get(attribute)
+        if parser is None:
+            return False
+        zone_id = int(zone_str)
+
+        # Only update existing zones from MQTT, don't create new ones
+        # Zone creation is handled by API discovery, which is rerun for zones
+        # that show up after startup, at most once per retry interval each
+        if zone_id not in self.zones:
+            now = time.monotonic()
+            last_request = self._requested_zones.get(zone_id)
+            if (
+                zone_id < MAX_ZONES
+                and self.discovery_ready.is_set()
+                and (last_request is None or now - last_request >= _NEW_ZONES_RETRY_INTERVAL)
+            ):
+                self._requested_zones[zone_id] = now
+                self._pending_new_zones.add(zone_id)
+                self._schedule_new_zones_discovery()
+            _LOGGER.debug(f"Received MQTT message for unknown zone {zone_id}, skipping")
+            return False
+
+        value = parser(payload)
+        if value is None:
+            return False
+
+        # Broker echo of an optimistic update we already pushed to listeners
+        optimistic = self._optimistic.pop((zone_id, attribute), None)
+        if (
+            optimistic is not None
+            and optimistic[0] == value
+            and time.monotonic() - optimistic[1] < _OPTIMISTIC_ECHO_WINDOW
+        ):
+            return False
+
+        old_val = self.zones[zone_id].get(attribute)
+        if old_val == value:
+            # Retained replays and heartbeats that don't change state
+            return False
+        self.zones[zone_id][attribute] = value
+        self._dirty_zones.add(zone_id)
+        if attribute == "source":
+            _LOGGER.info(
+                "%s MQTT source zone_id=%s topic=%s old=%s new=%s",
+                _LOG_PREFIX, zone_id, topic, old_val, value,
+            )
+        return True
+
+    @callback
+    def async_add_zone_listener(
+        self, zone_id: int, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for updates of a single zone; returns a function to remove the listener."""
+        listeners = self._zone_listeners.setdefault(zone_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _schedule_flush(self) -> None:
+        """Schedule a single _flush for the current batch window.
+
+        self._pending is set while a flush is scheduled, so bursts of changes
+        share one flush.
+        """
+        if self._pending:
+            return
+        self._pending = True
+        self._flush_handle = self.hass.loop.call_later(self._batch_delay, self._flush)
+
+    def _flush(self) -> None:
+        """Push the accumulated zone changes to the listeners of the changed zones.
+
+        MQTT messages and optimistic updates mutate self.zones in place and add
+        the zone id to self._dirty_zones; only entities of those zones are
+        notified, instead of a coordinator-wide async_set_updated_data fan-out.
+        """
+        self._pending = False
+        self._flush_handle = None
+        dirty, self._dirty_zones = self._dirty_zones, set()
+        for zone_id in dirty:
+            for update_callback in list(self._zone_listeners.get(zone_id, ())):
+                update_callback()
+
+    @callback
+    def _schedule_new_zones_discovery(self) -> None:
+        """Schedule a single rediscovery for the unknown zones seen in this window."""
+        if self._new_zones_unsub is None:
+            self._new_zones_unsub = async_call_later(
+                self.hass, _NEW_ZONES_DELAY, self._flush_new_zones
+            )
+
+    @callback
+    def _flush_new_zones(self, _now: Any) -> None:
+        """Rediscover zones for the unknown zone ids collected so far."""
+        self._new_zones_unsub = None
+        if self._new_zones_task is not None and not self._new_zones_task.done():
+            # Still rediscovering; the running task picks the new ids up when done
+            return
+        zone_ids, self._pending_new_zones = self._pending_new_zones, set()
+        self._new_zones_task = self.entry.async_create_background_task(
+            self.hass,
+            self._async_discover_new_zones(zone_ids),
+            "ampbridge rediscover zones",
+        )
+
+    async def _async_discover_new_zones(self, zone_ids: set[int]) -> None:
+        """Rerun API discovery and announce the zones it added in one signal."""
         try:
-            host = self.entry.data["host"]
-            port = self.entry.data["port"]
-            _LOGGER.info(f"Connecting to MQTT broker at {host}:{port}")
-            self.mqtt_client.connect(host, port, 60)
-            self.mqtt_client.loop_start()
-        except Exception as err:
-            _LOGGER.error(f"Failed to connect to MQTT broker: {err}")
-            raise UpdateFailed(f"Failed to connect to MQTT broker: {err}")
-
-    def _on_connect(self, client: mqtt.Client, userdata: Any, flags: dict, rc: int) -> None:
-        """Handle MQTT connection."""
-        if rc == 0:
-            _LOGGER.info("Connected to MQTT broker")
-            self.connected = True
-            # Subscribe to all zone topics
-            client.subscribe(f"{MQTT_BASE_TOPIC}/#")
-            _LOGGER.info(f"Subscribed to {MQTT_BASE_TOPIC}/#")
-        else:
-            _LOGGER.error(f"Failed to connect to MQTT broker: {rc}")
-            self.connected = False
-
-    def _on_message(self, client: mqtt.Client, userdata: Any, msg: mqtt.MQTTMessage) -> None:
-        """Handle MQTT messages."""
-        try:
-            topic = msg.topic
-            payload = msg.payload.decode()
-            
-            _LOGGER.debug(f"Received MQTT message: {topic} = {payload}")
-            
-            # Parse topic to extract zone info
-            # Expected format: ampbridge/zones/{zone_id}/{attribute}
-            parts = topic.split("/")
-            if len(parts) >= 4 and parts[0] == "ampbridge" and parts[1] == "zones":
-                try:
-                    zone_id = int(parts[2])
-                    attribute = parts[3]
-                    
-                    # Only update existing zones from MQTT, don't create new ones
-                    # Zone creation is now handled by API discovery
-                    if zone_id not in self.zones:
-                        _LOGGER.debug(f"Received MQTT message for unknown zone {zone_id}, skipping")
-                        return
-                    
-                    # Update zone data
-                    if attribute == "name":
-                        self.zones[zone_id]["name"] = payload
-                    elif attribute == "volume":
-                        try:
-                            self.zones[zone_id]["volume"] = int(payload)
-                        except ValueError:
-                            _LOGGER.warning(f"Invalid volume value: {payload}")
-                    elif attribute == "mute":
-                        self.zones[zone_id]["mute"] = payload
-                    elif attribute == "source":
-                        old_val = self.zones[zone_id].get("source")
-                        self.zones[zone_id]["source"] = payload
-                        _LOGGER.info(
-                            "%s MQTT source zone_id=%s topic=%s old=%s new=%s",
-                            _LOG_PREFIX, zone_id, topic, old_val, payload,
-                        )
-                    elif attribute == "connected":
-                        self.zones[zone_id]["connected"] = payload
-                    
-                    # Trigger update - schedule on the event loop
-                    self.hass.loop.call_soon_threadsafe(
-                        lambda: self.async_set_updated_data(self.zones.copy())
-                    )
-                    
-                except ValueError:
-                    _LOGGER.warning(f"Invalid zone ID in topic: {topic}")
-                    
-        except Exception as err:
-            _LOGGER.error(f"Error processing MQTT message: {err}")
+            await self._async_rediscover(zone_ids)
+        finally:
+            # Unknown zones seen while this rediscovery was running
+            if self._pending_new_zones:
+                self._schedule_new_zones_discovery()
 
-    def _on_disconnect(self, client: mqtt.Client, userdata: Any, rc: int) -> None:
-        """Handle MQTT disconnection."""
-        _LOGGER.warning(f"Disconnected from MQTT broker: {rc}")
-        self.connected = False
+    async def _async_rediscover(self, zone_ids: set[int]) -> None:
+        """Run API discovery again and dispatch the zones that are new."""
+        known = set(self.zones)
+        await self._discover_zones_via_api()
+        # Discovery replaced the zone data, so refresh the existing entities too
+        self._dirty_zones.update(known.intersection(self.zones))
+        self._schedule_flush()
+        new_zones = [
+            (zone_id, name) for zone_id, name in self.discovered_zones if zone_id not in known
+        ]
+        # Found zones are no longer unknown; the others are retried by a later
+        # message once the retry interval has passed
+        for zone_id, _ in new_zones:
+            self._requested_zones.pop(zone_id, None)
+        if not new_zones:
+            _LOGGER.debug("Zones %s not reported by the AmpBridge API", sorted(zone_ids))
+            return
+        _LOGGER.info("New AmpBridge zones discovered: %s", new_zones)
+        async_dispatcher_send(self.hass, self.signal_new_zones, new_zones)
 
     async def async_send_command(self, zone_id: int, command: str, value: str) -> None:
         """Send a command to AmpBridge via MQTT."""
@@ -148,143 +429,167 @@ class AmpBridgeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOG_PREFIX, zone_id, value, mapped_value,
             )
 
-        topic = f"{MQTT_BASE_TOPIC}/{zone_id}/{command}/set"
+        prefix = self._zone_topic_prefix.get(zone_id) or f"{MQTT_BASE_TOPIC}/{zone_id}/"
+        topic = prefix + command + "/set"
         _LOGGER.info("%s publish topic=%s payload=%r", _LOG_PREFIX, topic, mapped_value)
-        
-        def _publish():
-            self.mqtt_client.publish(topic, mapped_value)
-        
-        await self.hass.async_add_executor_job(_publish)
+        try:
+            await self.mqtt_client.publish(topic, mapped_value)
+        except aiomqtt.MqttError as err:
+            _LOGGER.error("%s publish to %s failed: %s", _LOG_PREFIX, topic, err)
+            return
 
         # Optimistic update: set zone state so the UI shows the selected option
         # immediately instead of waiting for MQTT. Backend updates will overwrite.
         if command == "source" and zone_id in self.zones:
             self.zones[zone_id]["source"] = value
-            self.async_set_updated_data(self.zones.copy())
+            self._optimistic[(zone_id, "source")] = (value, time.monotonic())
+            self._dirty_zones.add(zone_id)
+            self._schedule_flush()
 
     def _map_source_name(self, source_name: str) -> str:
         """Map source names to AmpBridge format."""
-        # Handle "Off" specially
-        if source_name == "Off":
-            _LOGGER.debug("%s _map_source_name %r -> Off (explicit)", _LOG_PREFIX, source_name)
-            return "Off"
-        
-        # First try hardcoded mappings for backwards compatibility
-        source_mapping = {
-            "Echo": "Source 1",
-            "Server": "Source 2",
-            "TV": "Source 3",
-            "Bluetooth": "Source 4",
-            "Aux": "Source 5",
-            "CD": "Source 6",
-            "Tuner": "Source 7",
-            "Phono": "Source 8",
-        }
-        
-        if source_name in source_mapping:
-            out = source_mapping[source_name]
-            _LOGGER.debug("%s _map_source_name %r -> %s (hardcoded)", _LOG_PREFIX, source_name, out)
-            return out
-        
-        # If not in hardcoded mapping, look up in available sources using
-        # backend order (same order as API) so "Source N" matches backend index
         available_sources = self._get_available_sources_in_backend_order()
-        try:
-            index = available_sources.index(source_name)
-            out = f"Source {index + 1}"
-            _LOGGER.info(
-                "%s _map_source_name %r -> %s (backend index %d, order=%s)",
-                _LOG_PREFIX, source_name, out, index, available_sources,
-            )
-            return out
-        except ValueError:
-            # Source name not found in available sources
-            # If it's already in "Source X" format, return as-is
-            if source_name.startswith("Source ") and source_name[7:].isdigit():
-                _LOGGER.debug("%s _map_source_name %r -> as-is (Source N format)", _LOG_PREFIX, source_name)
-                return source_name
-            # Otherwise, log warning and return original
+        mapped = _map_source(source_name, available_sources)
+        if mapped is None:
             _LOGGER.warning(
                 "%s _map_source_name could not map %r (not in available_sources=%s), returning as-is",
                 _LOG_PREFIX, source_name, available_sources,
             )
             return source_name
+        _LOGGER.debug(
+            "%s _map_source_name %r -> %s (order=%s)",
+            _LOG_PREFIX, source_name, mapped, available_sources,
+        )
+        return mapped
 
-    def get_available_sources(self) -> list[str]:
+    def get_available_sources(self) -> tuple[str, ...]:
         """Return available source names for the select dropdown.
         Uses backend order (from API) so the list matches source indices."""
-        ordered = self._get_available_sources_in_backend_order()
-        if ordered:
-            return ordered
-        # Fallback if no zones yet: unique names sorted (legacy)
-        sources = set()
-        for zone_data in self.zones.values():
-            sources.update(zone_data.get("available_sources", []))
-        return sorted(list(sources))
-
-    def _get_available_sources_in_backend_order(self) -> list[str]:
+        if self._available_sources is None:
+            ordered = self._get_available_sources_in_backend_order()
+            if ordered:
+                self._available_sources = ordered
+            else:
+                # Fallback if no zones yet: unique names sorted (legacy)
+                sources = set()
+                for zone_data in self.zones.values():
+                    sources.update(zone_data.get("available_sources", []))
+                self._available_sources = tuple(sorted(sources))
+        return self._available_sources
+
+    def get_source_options(self) -> list[str]:
+        """Return the select options: "Off" followed by the available sources.
+
+        Returns a new list, so callers can't modify the cached options.
+        """
+        if self._source_options is None:
+            self._source_options = ("Off", *self.get_available_sources())
+        return list(self._source_options)
+
+    def _get_available_sources_in_backend_order(self) -> tuple[str, ...]:
         """Return available_sources in the same order as the backend (API source index order).
-        Used for mapping display name -> 'Source N' so we send the correct index."""
-        for zone_data in self.zones.values():
-            sources = zone_data.get("available_sources", [])
-            if sources:
-                return list(sources)
-        return []
+        Used for mapping display name -> 'Source N' so we send the correct index.
+        The result is cached until the zones' available_sources change."""
+        if self._sources_cache is None:
+            ordered: tuple[str, ...] = ()
+            for zone_data in self.zones.values():
+                sources = zone_data.get("available_sources", [])
+                if sources:
+                    ordered = tuple(sources)
+                    break
+            self._sources_cache = ordered
+        return self._sources_cache
+
+    def _invalidate_sources_cache(self) -> None:
+        """Drop the cached source ordering after available_sources changed."""
+        self._sources_cache = None
+        self._available_sources = None
+        self._source_options = None
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via MQTT."""
         # Data is updated via MQTT messages, so we just return current data
-        return self.zones.copy()
+        return self.zones
 
     async def _discover_zones_via_api(self) -> None:
         """Discover zones via API call."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}/zones") as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get("success") and "zones" in data:
-                            _LOGGER.info(
-                                "%s API discovery: %d zones",
-                                _LOG_PREFIX, len(data["zones"]),
+            session = async_get_clientsession(self.hass)
+            async with session.get(f"{self.api_url}/zones", timeout=_API_TIMEOUT) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get("success") and "zones" in data:
+                        # Convert API zones to our format, keeping the
+                        # identity of self.zones stable for listeners
+                        zones: dict[int, dict[str, Any]] = {}
+                        rejected: list[Any] = []
+                        duplicates: list[int] = []
+                        for z in data["zones"]:
+                            zone_id = z.get("id") if isinstance(z, dict) else None
+                            if (
+                                not isinstance(zone_id, int)
+                                or isinstance(zone_id, bool)
+                                or not 0 <= zone_id < MAX_ZONES
+                            ):
+                                rejected.append(zone_id)
+                            elif zone_id in zones:
+                                duplicates.append(zone_id)
+                            else:
+                                zones[zone_id] = _zone_from_api(z)
+                        if rejected:
+                            _LOGGER.warning(
+                                "Ignoring AmpBridge zones without an id in 0-%d: %s",
+                                MAX_ZONES - 1, rejected,
                             )
-                            # Convert API zones to our format
-                            for zone_data in data["zones"]:
-                                zone_id = zone_data["id"]
-                                source = zone_data.get("source")
-                                available_sources = zone_data.get("available_sources", [])
-                                _LOGGER.info(
-                                    "%s API zone zone_id=%s name=%s source=%s available_sources=%s",
-                                    _LOG_PREFIX, zone_id, zone_data.get("name"),
-                                    source, available_sources,
-                                )
-                                self.zones[zone_id] = {
-                                    "zone_id": zone_id,
-                                    "name": zone_data["name"],
-                                    "volume": zone_data["volume"],
-                                    "mute": "ON" if zone_data["muted"] else "OFF",
-                                    "source": source,
-                                    "connected": "ON" if zone_data["connected"] else "OFF",
-                                    "available_sources": available_sources,
-                                }
-                            
-                            # Trigger update with discovered zones
-                            self.async_set_updated_data(self.zones.copy())
-                        else:
-                            _LOGGER.error("API returned unsuccessful response")
+                        if duplicates:
+                            _LOGGER.warning(
+                                "Ignoring duplicate AmpBridge zone ids: %s", duplicates
+                            )
+                        # No await until the end of the swap, so MQTT messages
+                        # applied on the same event loop can't interleave with it
+                        self.zones.clear()
+                        self.zones.update(zones)
+                        self.zone_slots = [zones.get(zone_id) for zone_id in range(MAX_ZONES)]
+                        _LOGGER.info(
+                            "%s API discovery: %d zones %s",
+                            _LOG_PREFIX, len(self.zones), list(self.zones),
+                        )
+                        self._invalidate_sources_cache()
+                        self._zone_topic_prefix = {
+                            zone_id: f"{MQTT_BASE_TOPIC}/{zone_id}/" for zone_id in self.zones
+                        }
+                        self.discovered_zones = [
+                            (zone_id, zone.get("name") or DEFAULT_ZONE_NAMES[zone_id])
+                            for zone_id, zone in self.zones.items()
+                        ]
+
                     else:
-                        _LOGGER.error(f"API request failed with status {response.status}")
+                        _LOGGER.error("API returned unsuccessful response")
+                else:
+                    _LOGGER.error(f"API request failed with status {response.status}")
         except Exception as err:
             _LOGGER.error(f"Failed to discover zones via API: {err}")
+        finally:
+            self.discovery_ready.set()
 
     async def async_stop(self) -> None:
         """Stop the MQTT client."""
-        if self.mqtt_client:
-            await self.hass.async_add_executor_job(self._stop_mqtt_client)
-
-    def _stop_mqtt_client(self) -> None:
-        """Stop the MQTT client in executor thread."""
-        if self.mqtt_client:
-            self.mqtt_client.loop_stop()
-            self.mqtt_client.disconnect()
-            self.mqtt_client = None
+        # Cancel the rediscovery first, it may schedule another one on exit
+        if self._new_zones_task:
+            self._new_zones_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._new_zones_task
+            self._new_zones_task = None
+        if self._new_zones_unsub:
+            self._new_zones_unsub()
+            self._new_zones_unsub = None
+        if self._mqtt_task:
+            self._mqtt_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._mqtt_task
+            self._mqtt_task = None
+        if self._flush_handle:
+            # Last, so nothing above can schedule another flush into removed entities
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._pending = False
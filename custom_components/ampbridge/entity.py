@@ -0,0 +1,109 @@
+"""Base entity for AmpBridge zones."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DEFAULT_ZONE_NAMES, DOMAIN
+from .coordinator import AmpBridgeCoordinator
+
+
+class AmpBridgeZoneEntity(CoordinatorEntity):
+    """Entity of a single AmpBridge zone, updated only when that zone changes.
+
+    Subclasses store their state from the zone data in _update_from_zone.
+    """
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: AmpBridgeCoordinator, config_entry: ConfigEntry, zone_id: int, zone_name: str):
+        """Initialize the zone entity."""
+        super().__init__(coordinator)
+        self._config_entry = config_entry
+        self._zone_id = zone_id
+        self._zone_name = zone_name
+        # Device info is cached per zone name and refreshed on coordinator updates
+        self._cached_name: str | None = None
+        self._cached_device_info: DeviceInfo | None = None
+        self._identifiers = {(DOMAIN, f"zone_{zone_id}")}
+        self._refresh_device_info()
+        # State is pushed by the coordinator for this zone only
+        self._update_from_zone(coordinator.zone_slots[zone_id])
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return self._cached_device_info
+
+    def _refresh_device_info(self) -> None:
+        """Rebuild the cached device info if the zone name changed."""
+        zone_data = self.coordinator.zone_slots[self._zone_id]
+        current_name = (zone_data and zone_data.get("name")) or DEFAULT_ZONE_NAMES[self._zone_id]
+
+        # Only rebuild when the zone name changed
+        if current_name == self._cached_name:
+            return
+
+        self._cached_name = current_name
+        self._cached_device_info = DeviceInfo(
+            identifiers=self._identifiers,
+            name=f"AmpBridge - {current_name}",
+            manufacturer="AmpBridge",
+            model="Audio Zone",
+        )
+        if self.hass is not None:
+            # device_info is only read when the entity is added, so rename an
+            # existing device in the registry directly
+            registry = dr.async_get(self.hass)
+            device = registry.async_get_device(identifiers=self._identifiers)
+            if device is not None and device.name != self._cached_device_info["name"]:
+                registry.async_update_device(device.id, name=self._cached_device_info["name"])
+
+    def _update_from_zone(self, zone_data: dict[str, Any] | None) -> None:
+        """Store the entity state from the zone data (None if the zone is unknown)."""
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates of this entity's zone only."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_zone_listener(self._zone_id, self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the pushed zone state and write the state."""
+        self._refresh_device_info()
+        self._update_from_zone(self.coordinator.zone_slots[self._zone_id])
+        super()._handle_coordinator_update()
+
+
+@callback
+def async_setup_zone_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    coordinator: AmpBridgeCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    entity_cls: type[AmpBridgeZoneEntity],
+) -> None:
+    """Add an entity_cls entity per discovered zone, and for zones discovered later."""
+
+    @callback
+    def async_add_zones(zones: list[tuple[int, str]]) -> None:
+        """Add entities for the given (zone_id, name) pairs in one batch."""
+        async_add_entities(
+            entity_cls(coordinator, config_entry, zone_id, zone_name)
+            for zone_id, zone_name in zones
+        )
+
+    async_add_zones(coordinator.discovered_zones)
+    # Zones added on the AmpBridge later are announced by the coordinator
+    config_entry.async_on_unload(
+        async_dispatcher_connect(hass, coordinator.signal_new_zones, async_add_zones)
+    )
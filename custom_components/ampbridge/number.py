@@ -1,21 +1,26 @@
 """Number platform for AmpBridge integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ICON_NUMBER
+from .const import DOMAIN, ICON_NUMBER, MAX_ZONES
 from .coordinator import AmpBridgeCoordinator
+from .entity import AmpBridgeZoneEntity, async_setup_zone_entities
 
 _LOGGER = logging.getLogger(__name__)
 
+# Interned unique ids indexed by zone_id
+_UNIQUE_IDS = tuple(
+    sys.intern(f"ampbridge_zone_{zone_id}_volume_number") for zone_id in range(MAX_ZONES)
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -25,72 +30,31 @@ async def async_setup_entry(
     """Set up AmpBridge number entities based on a config entry."""
     coordinator: AmpBridgeCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    # Create number entities for discovered zones
-    entities = []
-    
-    # Wait for zones to be discovered via MQTT
-    for _ in range(50):  # 50 * 0.2s = 10 seconds
-        if coordinator.data:
-            break
-        await asyncio.sleep(0.2)
-    
     # Create number entities for all discovered zones
-    for zone_id, zone_data in coordinator.data.items():
-        entities.append(
-            AmpBridgeVolumeNumber(coordinator, config_entry, zone_id, zone_data.get("name", f"Zone {zone_id + 1}"))
-        )
-
-    async_add_entities(entities)
+    async_setup_zone_entities(hass, config_entry, coordinator, async_add_entities, AmpBridgeVolumeNumber)
 
 
-class AmpBridgeVolumeNumber(CoordinatorEntity, NumberEntity):
+class AmpBridgeVolumeNumber(AmpBridgeZoneEntity, NumberEntity):
     """Representation of an AmpBridge volume number entity."""
 
     def __init__(self, coordinator: AmpBridgeCoordinator, config_entry: ConfigEntry, zone_id: int, zone_name: str):
         """Initialize the number entity."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._zone_id = zone_id
-        self._zone_name = zone_name
-        # Name will be dynamic via property
-        self._attr_unique_id = f"ampbridge_zone_{zone_id}_volume_number"
+        super().__init__(coordinator, config_entry, zone_id, zone_name)
+        self._attr_unique_id = _UNIQUE_IDS[zone_id]
         self._attr_icon = ICON_NUMBER
         self._attr_native_min_value = 0
         self._attr_native_max_value = 100
         self._attr_native_step = 1
         self._attr_native_unit_of_measurement = "%"
-        # Device info will be dynamic via property
 
     @property
     def name(self) -> str:
         """Return the name of the number entity."""
         return "Volume"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        zone_data = self.coordinator.data.get(self._zone_id)
-        if zone_data:
-            current_name = zone_data.get("name", f"Zone {self._zone_id + 1}")
-        else:
-            current_name = f"Zone {self._zone_id + 1}"
-        
-        return {
-            "identifiers": {(DOMAIN, f"zone_{self._zone_id}")},
-            "name": f"AmpBridge - {current_name}",
-            "manufacturer": "AmpBridge",
-            "model": "Audio Zone",
-        }
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        zone_data = self.coordinator.data.get(self._zone_id)
-        if zone_data:
-            volume = zone_data.get("volume")
-            if volume is not None:
-                return float(volume)
-        return None
+    def _update_from_zone(self, zone_data: dict[str, Any] | None) -> None:
+        """Store the zone volume, already stored as float by the coordinator."""
+        self._attr_native_value = zone_data.get("volume") if zone_data else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
@@ -1,22 +1,27 @@
 """Select platform for AmpBridge integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ICON_SOURCE
+from .const import DOMAIN, ICON_SOURCE, MAX_ZONES
 from .coordinator import AmpBridgeCoordinator
+from .entity import AmpBridgeZoneEntity, async_setup_zone_entities
 
 _LOGGER = logging.getLogger(__name__)
 _LOG_PREFIX = "[AmpBridge:source]"
 
+# Interned unique ids indexed by zone_id
+_UNIQUE_IDS = tuple(
+    sys.intern(f"ampbridge_zone_{zone_id}_source_select") for zone_id in range(MAX_ZONES)
+)
+
 # Default source options - will be dynamically updated from MQTT data
 DEFAULT_SOURCE_OPTIONS = ["Off", "Source 1", "Source 2", "Source 3", "Source 4"]
 
@@ -29,96 +34,51 @@ async def async_setup_entry(
     """Set up AmpBridge select entities based on a config entry."""
     coordinator: AmpBridgeCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    # Create select entities for discovered zones
-    entities = []
-    
-    # Wait for zones to be discovered via MQTT
-    for _ in range(50):  # 50 * 0.2s = 10 seconds
-        if coordinator.data:
-            break
-        await asyncio.sleep(0.2)
-    
-    _LOGGER.info("%s setup: discovered %d zones", _LOG_PREFIX, len(coordinator.data or {}))
+    _LOGGER.info("%s setup: discovered zones %s", _LOG_PREFIX, coordinator.discovered_zones)
     # Create select entities for all discovered zones
-    for zone_id, zone_data in (coordinator.data or {}).items():
-        name = zone_data.get("name", f"Zone {zone_id + 1}")
-        source = zone_data.get("source")
-        available = zone_data.get("available_sources", [])
-        _LOGGER.info(
-            "%s setup: zone_id=%s name=%s current_source=%s available_sources=%s",
-            _LOG_PREFIX, zone_id, name, source, available,
-        )
-        entities.append(
-            AmpBridgeSourceSelect(coordinator, config_entry, zone_id, name)
-        )
-
-    async_add_entities(entities)
+    async_setup_zone_entities(hass, config_entry, coordinator, async_add_entities, AmpBridgeSourceSelect)
 
 
-class AmpBridgeSourceSelect(CoordinatorEntity, SelectEntity):
+class AmpBridgeSourceSelect(AmpBridgeZoneEntity, SelectEntity):
     """Representation of an AmpBridge source select entity."""
 
     def __init__(self, coordinator: AmpBridgeCoordinator, config_entry: ConfigEntry, zone_id: int, zone_name: str):
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self._config_entry = config_entry
-        self._zone_id = zone_id
-        self._zone_name = zone_name
-        self._attr_unique_id = f"ampbridge_zone_{zone_id}_source_select"
+        super().__init__(coordinator, config_entry, zone_id, zone_name)
+        self._attr_unique_id = _UNIQUE_IDS[zone_id]
         self._attr_icon = ICON_SOURCE
-        # Device info will be dynamic via property
 
     @property
     def name(self) -> str:
         """Return the name of the select entity."""
         return "Source"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        zone_data = self.coordinator.data.get(self._zone_id)
-        if zone_data:
-            current_name = zone_data.get("name", f"Zone {self._zone_id + 1}")
-        else:
-            current_name = f"Zone {self._zone_id + 1}"
-        
-        return {
-            "identifiers": {(DOMAIN, f"zone_{self._zone_id}")},
-            "name": f"AmpBridge - {current_name}",
-            "manufacturer": "AmpBridge",
-            "model": "Audio Zone",
-        }
-
     @property
     def options(self) -> list[str]:
         """Return the list of available options."""
-        # Get available sources from coordinator and add "Off"
-        available_sources = self.coordinator.get_available_sources()
-        opts = ["Off"] + available_sources
+        # Available sources from coordinator, prefixed with "Off"
+        opts = self.coordinator.get_source_options()
         _LOGGER.debug(
             "%s options zone_id=%s -> %s",
             _LOG_PREFIX, self._zone_id, opts,
         )
         return opts
 
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option. Never return None so the entity state
+    def _update_from_zone(self, zone_data: dict[str, Any] | None) -> None:
+        """Store the current selected option. Never store None so the entity state
         never becomes 'unknown' (which causes the frontend to send option: '' and
         trigger validation errors)."""
-        zone_data = self.coordinator.data.get(self._zone_id)
-        opts = self.options
+        self._attr_current_option = "Off"
         if zone_data:
             current_source = zone_data.get("source")
-            if current_source and current_source in opts:
-                return current_source
-            # Source missing or not in options (e.g. stale/race) -> report Off, not None
-            _LOGGER.debug(
-                "%s current_option zone_id=%s zone_data.source=%s not in options, using Off",
-                _LOG_PREFIX, self._zone_id, current_source,
-            )
-            return "Off"
-        return "Off"
+            if current_source and current_source in self.options:
+                self._attr_current_option = current_source
+            else:
+                # Source missing or not in options (e.g. stale/race) -> report Off, not None
+                _LOGGER.debug(
+                    "%s current_option zone_id=%s zone_data.source=%s not in options, using Off",
+                    _LOG_PREFIX, self._zone_id, current_source,
+                )
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
@@ -133,8 +93,3 @@ class AmpBridgeSourceSelect(CoordinatorEntity, SelectEntity):
             )
             return
         await self.coordinator.async_send_command(self._zone_id, "source", option)
-    
-    @property
-    def should_poll(self) -> bool:
-        """Return False since we get updates via coordinator."""
-        return False
\ No newline at end of file
@@ -1,36 +0,0 @@
-"""Sensor platform for AmpBridge integration."""
-from __future__ import annotations
-
-import asyncio
-import logging
-from typing import Any
-
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import DOMAIN
-from .coordinator import AmpBridgeCoordinator
-
-_LOGGER = logging.getLogger(__name__)
-
-
-async def async_setup_entry(
-    hass: HomeAssistant,
-    config_entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up AmpBridge sensor based on a config entry."""
-    coordinator: AmpBridgeCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-
-    # Wait for zones to be discovered via MQTT
-    # Poll until we have zone data or timeout after 10 seconds
-    for _ in range(50):  # 50 * 0.2s = 10 seconds
-        if coordinator.data:
-            break
-        await asyncio.sleep(0.2)
-    
-    async_add_entities([])
-
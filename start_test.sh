@@ -7,11 +7,9 @@ echo "🌐 Home Assistant will be available at http://localhost:8123"
 echo ""
 
 # Create necessary directories
+# The integration itself is mounted from ./custom_components by docker-compose,
+# so Home Assistant loads the single source copy instead of a stale duplicate
 mkdir -p test_config
-mkdir -p test_config/custom_components
-
-# Copy the integration to the test config
-cp -r custom_components/ampbridge test_config/custom_components/
 
 # Start the containers
 docker-compose up -d
@@ -27,5 +25,6 @@ echo "   2. Click 'Add Integration'"
 echo "   3. Search for 'AmpBridge'"
 echo "   4. Enter your server details (192.168.1.233:1885)"
 echo ""
+echo "🧪 To run the integration test: pip install -r requirements_test.txt && python test_integration.py"
 echo "🛑 To stop: docker-compose down"
 echo "📊 To view logs: docker-compose logs -f homeassistant"
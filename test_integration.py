@@ -4,24 +4,43 @@ Test script for AmpBridge Home Assistant integration
 This script helps verify that the integration is working correctly
 """
 
-import requests
-import json
+import asyncio
+import contextlib
 import time
-import paho.mqtt.client as mqtt
-import threading
+from collections import deque
+
+import aiomqtt
+import httpx
+import orjson
+
+# Copies of MQTT_BASE_TOPIC and ZONE_ATTRIBUTES from
+# custom_components/ampbridge/const.py; importing them would import the
+# integration package and with it Home Assistant. Keep them in sync.
+MQTT_BASE_TOPIC = "ampbridge/zones"
+ZONE_ATTRIBUTES = ["volume", "mute", "source", "connected", "name"]
 
 class AmpBridgeTester:
     def __init__(self, ha_url="http://localhost:8123", mqtt_host="192.168.1.233", mqtt_port=1885):
         self.ha_url = ha_url
         self.mqtt_host = mqtt_host
         self.mqtt_port = mqtt_port
+        self.api_url = f"http://{mqtt_host}:4000/api"
         self.mqtt_client = None
-        self.mqtt_messages = []
+        # Zone state topics routed to (zone_id, attribute), built from the
+        # zones the AmpBridge API reports
+        self.zone_topics = {}
+        # Bounded so long listening windows don't grow memory without limit
+        self.mqtt_messages = deque(maxlen=10000)
+        # Latest value per zone attribute seen on MQTT
+        self.zone_states = {}
+        self.mqtt_listener = None
+        self.exit_stack = contextlib.AsyncExitStack()
         
-    def test_ha_connection(self):
+    async def test_ha_connection(self):
         """Test if Home Assistant is running"""
         try:
-            response = requests.get(f"{self.ha_url}/api/", timeout=5)
+            async with httpx.AsyncClient() as client:
+                response = await client.get(f"{self.ha_url}/api/", timeout=5)
             if response.status_code == 200:
                 print("✅ Home Assistant is running")
                 return True
@@ -31,58 +50,91 @@ class AmpBridgeTester:
             else:
                 print(f"❌ Home Assistant returned status {response.status_code}")
                 return False
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"❌ Cannot connect to Home Assistant: {e}")
             return False
     
-    def test_mqtt_connection(self):
+    async def discover_zones(self):
+        """Build the zone topic table from the zones reported by the AmpBridge API"""
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(f"{self.api_url}/zones", timeout=5)
+            data = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            print(f"⚠️  Cannot discover zones via the AmpBridge API: {e}")
+            return
+        
+        zones = data.get("zones") if isinstance(data, dict) else None
+        if not isinstance(zones, list):
+            print("⚠️  Unexpected AmpBridge API response, no zones discovered")
+            return
+        # Skip zones without an int id, like the integration's discovery does
+        zone_ids = [
+            zone["id"] for zone in zones
+            if isinstance(zone, dict)
+            and isinstance(zone.get("id"), int)
+            and not isinstance(zone["id"], bool)
+        ]
+        self.zone_topics = {
+            f"{MQTT_BASE_TOPIC}/{zone_id}/{attribute}": (zone_id, attribute)
+            for zone_id in zone_ids
+            for attribute in ZONE_ATTRIBUTES
+        }
+        print(f"✅ Discovered {len(zone_ids)} zones via the AmpBridge API")
+    
+    async def test_mqtt_connection(self):
         """Test MQTT connection to AmpBridge server"""
-        def on_connect(client, userdata, flags, rc):
-            if rc == 0:
-                print("✅ Connected to AmpBridge MQTT broker")
-                client.subscribe("ampbridge/zones/#")
-            else:
-                print(f"❌ Failed to connect to MQTT broker: {rc}")
+        await self.discover_zones()
+        client = aiomqtt.Client(self.mqtt_host, self.mqtt_port, keepalive=60)
+        try:
+            await self.exit_stack.enter_async_context(client)
+            print("✅ Connected to AmpBridge MQTT broker")
+            await client.subscribe(f"{MQTT_BASE_TOPIC}/#")
+        except aiomqtt.MqttError as e:
+            print(f"❌ MQTT connection failed: {e}")
+            return False
         
-        def on_message(client, userdata, msg):
+        self.mqtt_client = client
+        # Messages are consumed on the event loop until the tests finish
+        self.mqtt_listener = asyncio.create_task(self.listen_mqtt())
+        await asyncio.sleep(2)  # Wait for retained messages
+        return True
+    
+    async def listen_mqtt(self):
+        """Record MQTT messages from AmpBridge"""
+        # Printed in one batch after the listening window, not per message
+        async for msg in self.mqtt_client.messages:
+            topic = msg.topic.value
+            payload = msg.payload.decode(errors="replace")
             self.mqtt_messages.append({
-                'topic': msg.topic,
-                'payload': msg.payload.decode(),
+                'topic': topic,
+                'payload': payload,
                 'timestamp': time.time()
             })
-            print(f"📨 MQTT: {msg.topic} = {msg.payload.decode()}")
-        
-        self.mqtt_client = mqtt.Client()
-        self.mqtt_client.on_connect = on_connect
-        self.mqtt_client.on_message = on_message
-        
-        try:
-            self.mqtt_client.connect(self.mqtt_host, self.mqtt_port, 60)
-            self.mqtt_client.loop_start()
-            time.sleep(2)  # Wait for connection and messages
-            return True
-        except Exception as e:
-            print(f"❌ MQTT connection failed: {e}")
-            return False
+            route = self.zone_topics.get(topic)
+            if route is not None:
+                zone_id, attribute = route
+                self.zone_states.setdefault(zone_id, {})[attribute] = payload
     
-    def test_ampbridge_entities(self):
+    async def test_ampbridge_entities(self):
         """Test if AmpBridge entities are created in Home Assistant"""
         try:
             # This would require authentication in a real scenario
             # For now, we'll just check if we can access the API
-            response = requests.get(f"{self.ha_url}/api/states", timeout=5)
+            async with httpx.AsyncClient() as client:
+                response = await client.get(f"{self.ha_url}/api/states", timeout=5)
             if response.status_code == 200:
-                states = response.json()
-                ampbridge_entities = [s for s in states if 'ampbridge' in s.get('entity_id', '')]
-                print(f"✅ Found {len(ampbridge_entities)} AmpBridge entities")
+                states = orjson.loads(response.content)
                 
-                # Group entities by type
+                # Filter and group entities by type in one pass
                 entity_types = {}
-                for entity in ampbridge_entities:
-                    entity_type = entity['entity_id'].split('.')[0]
-                    if entity_type not in entity_types:
-                        entity_types[entity_type] = []
-                    entity_types[entity_type].append(entity)
+                entity_count = 0
+                for entity in states:
+                    entity_id = entity.get('entity_id', '')
+                    if 'ampbridge' in entity_id:
+                        entity_types.setdefault(entity_id.split('.', 1)[0], []).append(entity)
+                        entity_count += 1
+                print(f"✅ Found {entity_count} AmpBridge entities")
                 
                 for entity_type, entities in entity_types.items():
                     print(f"   {entity_type}: {len(entities)} entities")
@@ -91,7 +143,7 @@ class AmpBridgeTester:
                     if len(entities) > 3:
                         print(f"     ... and {len(entities) - 3} more")
                 
-                return len(ampbridge_entities) > 0
+                return entity_count > 0
             else:
                 print(f"❌ Failed to get states: {response.status_code}")
                 return False
@@ -99,47 +151,49 @@ class AmpBridgeTester:
             print(f"❌ Failed to check entities: {e}")
             return False
     
-    def send_test_command(self, zone_id=0, command="volume", value="50"):
+    async def send_test_command(self, zone_id=0, command="volume", value="50"):
         """Send a test command to AmpBridge"""
-        topic = f"ampbridge/zones/{zone_id}/{command}/set"
+        topic = f"{MQTT_BASE_TOPIC}/{zone_id}/{command}/set"
         try:
-            self.mqtt_client.publish(topic, value)
+            await self.mqtt_client.publish(topic, value)
             print(f"📤 Sent command: {topic} = {value}")
             return True
-        except Exception as e:
+        except aiomqtt.MqttError as e:
             print(f"❌ Failed to send command: {e}")
             return False
     
-    def run_tests(self):
+    async def run_tests(self):
         """Run all tests"""
         print("🧪 Starting AmpBridge Integration Tests")
         print("=" * 50)
         
-        # Test Home Assistant
+        # Test Home Assistant and MQTT concurrently
         print("\n1. Testing Home Assistant connection...")
-        ha_ok = self.test_ha_connection()
-        
-        # Test MQTT
         print("\n2. Testing MQTT connection to AmpBridge...")
-        mqtt_ok = self.test_mqtt_connection()
+        ha_ok, mqtt_ok = await asyncio.gather(
+            self.test_ha_connection(), self.test_mqtt_connection()
+        )
         
         if mqtt_ok:
             print("\n3. Listening for MQTT messages (10 seconds)...")
-            time.sleep(10)
+            await asyncio.sleep(10)
+            print("\n".join(f"📨 MQTT: {m['topic']} = {m['payload']}" for m in self.mqtt_messages))
             print(f"📊 Received {len(self.mqtt_messages)} MQTT messages")
+            for zone_id, state in sorted(self.zone_states.items()):
+                print(f"   Zone {zone_id}: {state}")
         
         # Test entities
         print("\n4. Testing AmpBridge entities...")
-        entities_ok = self.test_ampbridge_entities()
+        entities_ok = await self.test_ampbridge_entities()
         
         # Test command sending
         if mqtt_ok:
             print("\n5. Testing command sending...")
-            self.send_test_command(0, "volume", "75")
-            time.sleep(2)
-            self.send_test_command(0, "mute", "ON")
-            time.sleep(2)
-            self.send_test_command(0, "mute", "OFF")
+            await self.send_test_command(0, "volume", "75")
+            await asyncio.sleep(2)
+            await self.send_test_command(0, "mute", "ON")
+            await asyncio.sleep(2)
+            await self.send_test_command(0, "mute", "OFF")
         
         # Summary
         print("\n" + "=" * 50)
@@ -148,10 +202,12 @@ class AmpBridgeTester:
         print(f"   MQTT Connection: {'✅' if mqtt_ok else '❌'}")
         print(f"   Entities Found: {'✅' if entities_ok else '❌'}")
         
-        if self.mqtt_client:
-            self.mqtt_client.loop_stop()
-            self.mqtt_client.disconnect()
+        if self.mqtt_listener:
+            self.mqtt_listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.mqtt_listener
+        await self.exit_stack.aclose()
 
 if __name__ == "__main__":
     tester = AmpBridgeTester()
-    tester.run_tests()
+    asyncio.run(tester.run_tests())